@@ -1,3 +1,4 @@
-from .data import get_yfinance_data, get_csv_data, get_mt5_data
+from .data import get_yfinance_data, get_csv_data, get_mt5_data, get_yfinance_data_batch, get_mt5_data_batch
 
-from .utils import to_percent, to_percent_num, to_float, get_freq, scale
\ No newline at end of file
+from .utils import to_percent, to_percent_num, to_float, to_percent_array, to_percent_num_array, to_float_array, \
+    get_freq, scale, scale_jit, scale_array, make_scaler
\ No newline at end of file
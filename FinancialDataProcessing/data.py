@@ -1,16 +1,118 @@
+import os
+import hashlib
 import yfinance as yf
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 import MetaTrader5 as mt5
-from datetime import datetime
-from typing import Optional, List
-import pytz
+from numba import njit
+from joblib import Memory
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, date, timezone, timedelta
+from functools import lru_cache
+from typing import Optional, List, Dict, Callable, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import polars as pl
+
+# Column layouts of MetaTrader 5 CSV exports (the header row is skipped)
+_CSV_DAILY_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Price', 'TickVol', 'Vol', 'Spread']
+_CSV_INTRADAY_COLUMNS = ['Date', 'Time', 'Open', 'High', 'Low', 'Price', 'TickVol', 'Vol', 'Spread']
+_CSV_COLUMN_TYPES = {'Date': pa.timestamp('s'), 'Open': pa.float32(), 'High': pa.float32(), 'Low': pa.float32(),
+                     'Price': pa.float32()}
+_CSV_DATE_FORMAT = "%Y.%m.%d"
+
+# Price columns are stored as float32, which is ample precision for quotes
+_YF_PRICE_TYPES = {'Open': np.float32, 'High': np.float32, 'Low': np.float32, 'Close': np.float32}
+_MT5_PRICE_TYPES = {'open': np.float32, 'high': np.float32, 'low': np.float32, 'close': np.float32}
+
+# MetaTrader 5 timeframe constants by timeframe code
+_TIMEFRAMES: Dict[str, int] = {
+    "M1": mt5.TIMEFRAME_M1,
+    "M2": mt5.TIMEFRAME_M2,
+    "M3": mt5.TIMEFRAME_M3,
+    "M4": mt5.TIMEFRAME_M4,
+    "M5": mt5.TIMEFRAME_M5,
+    "M6": mt5.TIMEFRAME_M6,
+    "M10": mt5.TIMEFRAME_M10,
+    "M12": mt5.TIMEFRAME_M12,
+    "M15": mt5.TIMEFRAME_M15,
+    "M20": mt5.TIMEFRAME_M20,
+    "M30": mt5.TIMEFRAME_M30,
+    "H1": mt5.TIMEFRAME_H1,
+    "H2": mt5.TIMEFRAME_H2,
+    "H3": mt5.TIMEFRAME_H3,
+    "H4": mt5.TIMEFRAME_H4,
+    "H6": mt5.TIMEFRAME_H6,
+    "H8": mt5.TIMEFRAME_H8,
+    "H12": mt5.TIMEFRAME_H12,
+    "D1": mt5.TIMEFRAME_D1,
+    "W1": mt5.TIMEFRAME_W1,
+    "MN1": mt5.TIMEFRAME_MN1,
+}
+
+# Longest possible bar of each timeframe code
+_TIMEFRAME_LENGTHS: Dict[str, timedelta] = {
+    "M1": timedelta(minutes=1),
+    "M2": timedelta(minutes=2),
+    "M3": timedelta(minutes=3),
+    "M4": timedelta(minutes=4),
+    "M5": timedelta(minutes=5),
+    "M6": timedelta(minutes=6),
+    "M10": timedelta(minutes=10),
+    "M12": timedelta(minutes=12),
+    "M15": timedelta(minutes=15),
+    "M20": timedelta(minutes=20),
+    "M30": timedelta(minutes=30),
+    "H1": timedelta(hours=1),
+    "H2": timedelta(hours=2),
+    "H3": timedelta(hours=3),
+    "H4": timedelta(hours=4),
+    "H6": timedelta(hours=6),
+    "H8": timedelta(hours=8),
+    "H12": timedelta(hours=12),
+    "D1": timedelta(days=1),
+    "W1": timedelta(weeks=1),
+    "MN1": timedelta(days=31),
+}
+
+_UTC = timezone.utc
+
+# Parquet metadata entry holding the exact Arrow schema of a cached table
+_CACHE_SCHEMA_KEY = b'cache_schema'
+
+# Directory of the on-disk cache of Yahoo Finance responses, created on the first cached download
+YF_CACHE_DIR = os.environ.get('YF_CACHE_DIR', '.yf_cache')
+
+
+def _fetch_yfinance_history(ticker_symbol: str, start: Optional[str], end: Optional[str],
+                            timeframe: Optional[str]) -> pd.DataFrame:
+    """
+    Downloads the raw price history of a ticker from Yahoo Finance.
+    Responses are cached on disk, keyed on all the arguments.
+    """
+    return yf.Ticker(ticker_symbol).history(start=start, end=end, interval=timeframe)
+
+
+@lru_cache(maxsize=None)
+def _cached_yfinance_history(cache_dir: str):
+    """
+    Wraps _fetch_yfinance_history in a joblib cache stored in cache_dir.
+    """
+    return Memory(cache_dir, verbose=0).cache(_fetch_yfinance_history)
 
 
 def get_yfinance_data(ticker_symbol: str, start: Optional[str] = "1990-01-01", end: Optional[str] = "2022-12-31",
-                      timeframe: Optional[str] = '1d', drop_other_column=True) -> pd.DataFrame:
+                      timeframe: Optional[str] = '1d', drop_other_column=True,
+                      backend: str = 'pandas', cache_path: Optional[str] = None) \
+        -> Union[pd.DataFrame, 'pl.DataFrame']:
     """
     Fetch historical stock data from Yahoo Finance.
+    Ranges ending before today are cached on disk in YF_CACHE_DIR, which defaults to the YF_CACHE_DIR
+    environment variable or else '.yf_cache' in the working directory.
 
     Parameters: ticker_symbol (str): The ticker symbol of the stock.
     start (Optional[str]): The start date for the
@@ -22,25 +124,70 @@ def get_yfinance_data(ticker_symbol: str, start: Optional[str] = "1990-01-01", e
     interval (Optional[str]): The interval for the
     historical data.
     Valid intervals are '1d', '1wk', '1mo', etc. Defaults to '1d'.
+    backend (str): 'pandas' or 'polars'. Defaults to 'pandas'.
+    cache_path (Optional[str]): A directory in which the result is stored as Parquet
+    and reloaded from on later calls. Ranges ending today or later and empty results are not stored.
 
     Returns:
-        pd.DataFrame: A DataFrame containing the historical stock data.
+        Union[pd.DataFrame, pl.DataFrame]: A DataFrame containing the historical stock data.
+        Polars frames carry the index as a 'Date' column.
     """
-    # Create a ticker object
-    ticker = yf.Ticker(ticker_symbol)
+    _check_backend(backend)
+
+    # Ranges reaching today can still gain bars, so only completed ranges are served from the caches
+    completed = end is not None and pd.Timestamp(end).date() < date.today()
+
+    cache_file = None
+    if cache_path is not None and completed:
+        cache_file = _cache_file(cache_path, 'yfinance', ticker_symbol, start, end, timeframe, drop_other_column)
+        if os.path.exists(cache_file):
+            return _to_backend(_read_cache(cache_file).to_pandas(), backend)
 
     # Download historical data
-    rates = ticker.history(start=start, end=end, interval=timeframe)
+    if completed:
+        cached = _cached_yfinance_history(YF_CACHE_DIR).call_and_shelve(ticker_symbol, start, end, timeframe)
+        rates = cached.get()
+        if rates.empty:
+            # yfinance reports failures as an empty frame, which must not stick in the cache
+            cached.clear()
+    else:
+        rates = _fetch_yfinance_history(ticker_symbol, start, end, timeframe)
+    rates = rates.astype({col: dtype for col, dtype in _YF_PRICE_TYPES.items() if col in rates.columns})
     if drop_other_column:
-        drop_all_except(rates, 'Close')
+        df = drop_all_except(rates, 'Close').rename(columns={'Close': 'Price'})
+    else:
+        df = rates.rename(columns={'Close': 'Price'})
+    # Empty results are how yfinance reports failures, so they are not stored
+    if cache_file is not None and len(df) > 0:
+        _write_cache(pa.Table.from_pandas(df), cache_file)
 
-    df = rates.rename(columns={'Close': 'Price'})
+    return _to_backend(df, backend)
 
-    return df
+
+def get_yfinance_data_batch(ticker_symbols: List[str], start: Optional[str] = "1990-01-01",
+                            end: Optional[str] = "2022-12-31", timeframe: Optional[str] = '1d',
+                            max_workers: Optional[int] = None, **kwargs) -> Dict[str, pd.DataFrame]:
+    """
+    Fetch historical stock data for several tickers from Yahoo Finance concurrently.
+
+    Parameters:
+        ticker_symbols (List[str]): The ticker symbols of the stocks.
+        start (Optional[str]): The start date in 'YYYY-MM-DD' format. Defaults to '1990-01-01'.
+        end (Optional[str]): The end date in 'YYYY-MM-DD' format. Defaults to '2022-12-31'.
+        timeframe (Optional[str]): The interval for the historical data. Defaults to '1d'.
+        max_workers (Optional[int]): The number of download threads. Defaults to one per ticker, at most 16.
+        **kwargs: Further keyword arguments passed on to `get_yfinance_data`.
+
+    Returns:
+        Dict[str, pd.DataFrame]: The historical data of each ticker, keyed by ticker symbol.
+    """
+    return _fetch_batch(lambda symbol: get_yfinance_data(symbol, start, end, timeframe, **kwargs),
+                        ticker_symbols, max_workers)
 
 
-def get_csv_data(file_path: str, delim: Optional[str] = "\t", dailyBars: Optional[bool] = True, drop_other_column=True) \
-        -> pd.DataFrame:
+def get_csv_data(file_path: str, delim: Optional[str] = "\t", dailyBars: Optional[bool] = True, drop_other_column=True,
+                 backend: str = 'pandas', cache_path: Optional[str] = None) \
+        -> Union[pd.DataFrame, 'pl.DataFrame']:
     """
       Reads data from a CSV file and processes it according to the specified settings.
 
@@ -50,19 +197,41 @@ def get_csv_data(file_path: str, delim: Optional[str] = "\t", dailyBars: Optiona
           Default to tab ('\t').
           dailyBars (Optional[bool]): If True, processes data as daily bars.
           If False, processes data as intraday bars.
+          backend (str): 'pandas' or 'polars'. Defaults to 'pandas'.
+          cache_path (Optional[str]): A directory in which the parsed file is stored as Parquet
+          and reloaded from on later calls, until the CSV file changes.
 
       Returns:
-          pd.DataFrame: A DataFrame containing the processed data.
+          Union[pd.DataFrame, pl.DataFrame]: A DataFrame containing the processed data.
+          Polars frames carry the index as a 'Datetime' column.
+          When other columns are kept, 'Date' holds datetimes and 'Time' holds datetime.time values
+          rather than the raw strings of the file.
       """
-    df = pd.read_csv(file_path, delimiter=delim)
+    _check_backend(backend)
 
-    if dailyBars:
-        df.columns = ['Date', 'Open', 'High', 'Low', 'Price', 'TickVol', 'Vol', 'Spread']
-        df['Datetime'] = pd.to_datetime(df['Date'])
+    cache_file = None
+    if cache_path is not None:
+        stat = os.stat(file_path)
+        cache_file = _cache_file(cache_path, 'csv', os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size,
+                                 delim, dailyBars, drop_other_column)
+
+    if cache_file is not None and os.path.exists(cache_file):
+        table = _read_cache(cache_file)
     else:
-        df.columns = ['Date', 'Time', 'Open', 'High', 'Low', 'Price', 'TickVol', 'Vol', 'Spread']
-        df['Datetime'] = pd.to_datetime(df['Date'] + ' ' + df['Time'])
+        table = _read_csv_table(file_path, delim, dailyBars, drop_other_column)
+        if cache_file is not None:
+            _write_cache(table, cache_file)
+
+    if backend == 'polars':
+        import polars as pl
 
+        # Polars adopts the Arrow buffers without copying
+        df = pl.from_arrow(table, rechunk=False)
+        if drop_other_column:
+            df = drop_all_except(df, 'Price', index_column='Datetime')
+        return df
+
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
     df.set_index('Datetime', inplace=True)
 
     if drop_other_column:
@@ -71,10 +240,49 @@ def get_csv_data(file_path: str, delim: Optional[str] = "\t", dailyBars: Optiona
     return df
 
 
+def _read_csv_table(file_path: str, delim: str, dailyBars: bool, drop_other_column: bool) -> pa.Table:
+    """
+    Parses a MetaTrader 5 CSV export into an Arrow table with a leading Datetime column.
+    """
+    if dailyBars:
+        column_names = _CSV_DAILY_COLUMNS
+        column_types = _CSV_COLUMN_TYPES
+    else:
+        # Times are parsed natively too, so the date and time never go through string concatenation
+        column_names = _CSV_INTRADAY_COLUMNS
+        column_types = {**_CSV_COLUMN_TYPES, 'Time': pa.time32('s')}
+
+    # Only parse the columns that survive when the others are dropped
+    include_columns = None
+    if drop_other_column:
+        include_columns = [col for col in column_names if col in ('Date', 'Time', 'Price')]
+
+    # Arrow parses the columns in parallel straight into typed buffers
+    table = pacsv.read_csv(
+        file_path,
+        read_options=pacsv.ReadOptions(column_names=column_names, skip_rows=1),
+        parse_options=pacsv.ParseOptions(delimiter=delim),
+        convert_options=pacsv.ConvertOptions(column_types=column_types, include_columns=include_columns,
+                                             timestamp_parsers=[_CSV_DATE_FORMAT, pacsv.ISO8601]))
+
+    if dailyBars:
+        datetimes = table['Date']
+    else:
+        # time32[s] holds seconds since midnight; reinterpret it as a duration to add to the date
+        time_of_day = table['Time'].cast(pa.int32()).cast(pa.int64()).cast(pa.duration('s'))
+        datetimes = pc.add(table['Date'], time_of_day)
+    table = table.add_column(0, 'Datetime', datetimes)
+    if drop_other_column:
+        table = table.select(['Datetime', 'Price'])
+
+    return table
+
+
 def get_mt5_data(authorized: [bool], symbol: str, timeframe: str,
                  start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
                  start_pos: Optional[int] = None, end_pos: Optional[int] = None,
-                 drop_other_column=True) -> Optional[pd.DataFrame]:
+                 drop_other_column=True, backend: str = 'pandas',
+                 cache_path: Optional[str] = None) -> Optional[Union[pd.DataFrame, 'pl.DataFrame']]:
     """
     Fetches historical data from MetaTrader 5 for a given symbol within a specified date range and timeframe.
 
@@ -87,55 +295,44 @@ def get_mt5_data(authorized: [bool], symbol: str, timeframe: str,
         start_pos
         end_pos
         drop_other_column
+        backend (str): 'pandas' or 'polars'. Defaults to 'pandas'.
+        cache_path (Optional[str]): A directory in which the result is stored as Parquet and reloaded from
+                                    on later calls. Only non-empty date ranges whose last bar has closed are
+                                    stored, as position-based requests are relative to the latest bar.
 
     Returns:
-        Optional[pd.DataFrame]: A DataFrame containing the historical data with Datetime index.
-                                Returns None if data fetching fails.
+        Optional[Union[pd.DataFrame, pl.DataFrame]]: A DataFrame containing the historical data with Datetime
+                                index, or a Datetime column for Polars. Returns None if data fetching fails.
     """
+    _check_backend(backend)
+
     if not authorized:
         print("Not authorized to access MT5 data.")
         return
 
     # Get the timeframe
-    timeframes = {
-        "M1": mt5.TIMEFRAME_M1,
-        "M2": mt5.TIMEFRAME_M2,
-        "M3": mt5.TIMEFRAME_M3,
-        "M4": mt5.TIMEFRAME_M4,
-        "M5": mt5.TIMEFRAME_M5,
-        "M6": mt5.TIMEFRAME_M6,
-        "M10": mt5.TIMEFRAME_M10,
-        "M12": mt5.TIMEFRAME_M12,
-        "M15": mt5.TIMEFRAME_M15,
-        "M20": mt5.TIMEFRAME_M20,
-        "M30": mt5.TIMEFRAME_M30,
-        "H1": mt5.TIMEFRAME_H1,
-        "H2": mt5.TIMEFRAME_H2,
-        "H3": mt5.TIMEFRAME_H3,
-        "H4": mt5.TIMEFRAME_H4,
-        "H6": mt5.TIMEFRAME_H6,
-        "H8": mt5.TIMEFRAME_H8,
-        "H12": mt5.TIMEFRAME_H12,
-        "D1": mt5.TIMEFRAME_D1,
-        "W1": mt5.TIMEFRAME_W1,
-        "MN1": mt5.TIMEFRAME_MN1,
-    }
-
-    bar_time = timeframes.get(timeframe)
+    bar_time = _TIMEFRAMES.get(timeframe)
     if bar_time is None:
         print(f"Invalid timeframe: {timeframe}")
         return None
 
     df = None
+    cache_file = None
 
     rates = None
     if start_date is not None and end_date is not None:
-        # Set time zone to UTC
-        timezone = pytz.timezone("Etc/UTC")
-
-        # Convert start and end dates to datetime objects in UTC
-        #start_date = datetime.strptime(start_date, "%Y-%m-%d").replace(tzinfo=timezone)
-        #end_date = datetime.strptime(end_date, "%Y-%m-%d").replace(tzinfo=timezone)
+        # Naive start and end dates are taken to be in UTC
+        if start_date.tzinfo is None:
+            start_date = start_date.replace(tzinfo=_UTC)
+        if end_date.tzinfo is None:
+            end_date = end_date.replace(tzinfo=_UTC)
+
+        # A full bar length after end_date, the current bar starts after it, so every bar in the range has closed
+        completed = end_date < datetime.now(_UTC) - _TIMEFRAME_LENGTHS[timeframe]
+        if cache_path is not None and (start_pos is None or end_pos is None) and completed:
+            cache_file = _cache_file(cache_path, 'mt5', symbol, timeframe, start_date, end_date, drop_other_column)
+            if os.path.exists(cache_file):
+                return _to_backend(_read_cache(cache_file).to_pandas(), backend)
 
         # Fetch data from MetaTrader 5 between start and end dates
         rates = mt5.copy_rates_range(symbol, bar_time, start_date, end_date)
@@ -148,34 +345,180 @@ def get_mt5_data(authorized: [bool], symbol: str, timeframe: str,
         print(f"Failed to fetch data for {symbol}")
         return None
 
-        # Create DataFrame out of the obtained data
-    df = pd.DataFrame(rates)
-    df['Datetime'] = pd.to_datetime(df['time'], unit='s')
-    df.set_index('Datetime', inplace=True)
+    # MT5 times are epoch seconds, so the cast to datetime64[s] is a reinterpretation rather than a parse
+    index = pd.DatetimeIndex(rates['time'].astype('datetime64[s]'), name='Datetime')
+
+    # Create DataFrame out of the obtained data
     if drop_other_column:
-        drop_all_except(df, 'close')
-    df = df.rename(columns={'close': 'Price'})
+        # Build the close column straight from the structured array instead of the full frame, filling its gaps
+        # as drop_all_except does and adopting the kernel's output rather than letting the constructor copy it
+        close = _fill_gaps_1d(rates['close'].astype(np.float32, copy=False))
+        df = pd.DataFrame({'Price': close}, index=index, copy=False)
+    else:
+        # Build each column with its final name and dtype, so no renamed or recast copy of the frame is made
+        columns = {}
+        for name in rates.dtype.names:
+            values = rates[name]
+            if name in _MT5_PRICE_TYPES:
+                values = values.astype(_MT5_PRICE_TYPES[name], copy=False)
+            columns['Price' if name == 'close' else name] = values
+        df = pd.DataFrame(columns, index=index)
+
+    # No rates usually means the terminal has not synced the history yet, so they are not stored
+    if cache_file is not None and len(df) > 0:
+        _write_cache(pa.Table.from_pandas(df), cache_file)
+
+    return _to_backend(df, backend)
+
+
+def get_mt5_data_batch(authorized: [bool], symbols: List[str], timeframe: str,
+                       start_date: Optional[datetime] = None, end_date: Optional[datetime] = None,
+                       start_pos: Optional[int] = None, end_pos: Optional[int] = None,
+                       max_workers: Optional[int] = None, **kwargs) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Fetches historical data from MetaTrader 5 for several symbols concurrently.
+    The MT5 Python binding serializes requests to the terminal internally, so the speedup is
+    smaller than for `get_yfinance_data_batch`.
+
+    Parameters:
+        authorized (bool): authorized to access MT5 data.
+        symbols (List[str]): The symbols of the tickers to fetch data for.
+        timeframe (str): The timeframe code (e.g., 'M1', 'H1', 'D1').
+        start_date, end_date, start_pos, end_pos: As for `get_mt5_data`.
+        max_workers (Optional[int]): The number of fetch threads. Defaults to one per symbol, at most 16.
+        **kwargs: Further keyword arguments passed on to `get_mt5_data`.
+
+    Returns:
+        Dict[str, Optional[pd.DataFrame]]: The historical data of each symbol, keyed by symbol.
+                                           Symbols whose data fetching failed map to None.
+    """
+    return _fetch_batch(lambda symbol: get_mt5_data(authorized, symbol, timeframe, start_date, end_date,
+                                                    start_pos, end_pos, **kwargs),
+                        symbols, max_workers)
+
+
+def _fetch_batch(fetch: Callable[[str], Optional[pd.DataFrame]], symbols: List[str],
+                 max_workers: Optional[int] = None) -> Dict[str, Optional[pd.DataFrame]]:
+    """
+    Runs a single-symbol loader for each symbol on a thread pool.
+    The loaders are I/O bound and release the GIL while waiting, so threads overlap the requests.
+    """
+    if not symbols:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or min(16, len(symbols))) as executor:
+        return dict(zip(symbols, executor.map(fetch, symbols)))
+
+
+def _cache_file(cache_path: str, *key) -> str:
+    """
+    Returns the Parquet cache file in cache_path for a request, named by a hash of the request's key.
+    """
+    os.makedirs(cache_path, exist_ok=True)
+    digest = hashlib.sha1(repr(key).encode()).hexdigest()
+    return os.path.join(cache_path, f"{digest}.parquet")
+
+
+def _write_cache(table: pa.Table, cache_file: str) -> None:
+    """
+    Writes a table to a Parquet cache file along with its exact Arrow schema.
+    Parquet stores second-resolution times as milliseconds, so the schema is needed to restore them.
+    """
+    metadata = {**(table.schema.metadata or {}), _CACHE_SCHEMA_KEY: table.schema.serialize().to_pybytes()}
+    pq.write_table(table.replace_schema_metadata(metadata), cache_file, compression='snappy')
 
+
+def _read_cache(cache_file: str) -> pa.Table:
+    """
+    Reads a table written by `_write_cache`, cast back to its original Arrow schema.
+    """
+    schema = pa.ipc.read_schema(pa.py_buffer(pq.read_schema(cache_file).metadata[_CACHE_SCHEMA_KEY]))
+    return pq.read_table(cache_file, schema=schema, memory_map=True)
+
+
+def _check_backend(backend: str) -> None:
+    """
+    Raises a ValueError for an unsupported DataFrame backend.
+    """
+    if backend not in ('pandas', 'polars'):
+        raise ValueError(f"Invalid backend: {backend}. Expected 'pandas' or 'polars'.")
+
+
+def _to_backend(df: pd.DataFrame, backend: str) -> Union[pd.DataFrame, 'pl.DataFrame']:
+    """
+    Converts a loader's pandas output to the requested backend.
+    Polars has no index, so the index becomes the first column.
+    """
+    if backend == 'polars':
+        import polars as pl
+
+        return pl.from_pandas(df, include_index=True, rechunk=False)
     return df
 
 
-def drop_all_except(df: pd.DataFrame, keep_column: str) -> pd.DataFrame:
+def drop_all_except(df: Union[pd.DataFrame, 'pl.DataFrame'], keep_column: str,
+                    index_column: Optional[str] = None) -> Union[pd.DataFrame, 'pl.DataFrame']:
     """
     Drops all columns from the DataFrame except the specified column.
+    The input DataFrame is not modified; it is returned as-is when it already holds only a gap-free keep_column.
+    Polars frames have no index, so the column standing in for it can be kept as well; their nulls are filled natively.
 
     Parameters:
-        df (pd.DataFrame): The input DataFrame.
+        df (Union[pd.DataFrame, pl.DataFrame]): The input DataFrame.
         keep_column (str): The name of the column to keep.
+        index_column (Optional[str]): For Polars frames, the name of a column holding the index, kept ahead of
+        keep_column. Pandas frames keep their index regardless.
 
     Returns:
-        pd.DataFrame: The DataFrame with only the specified column kept.
+        Union[pd.DataFrame, pl.DataFrame]: The DataFrame with only the specified column kept.
     """
-    columns_to_drop = [col for col in df.columns if col != keep_column]
-    df.drop(columns=columns_to_drop, inplace=True)
+    if not isinstance(df, pd.DataFrame):
+        import polars as pl
 
-    # Backward Fill then Fill forward remaining NaNs
-    df = df.ffill().bfill()
+        index_columns = [index_column] if index_column is not None and index_column != keep_column else []
+        # Nothing to keep, as in the pandas branch below
+        if keep_column not in df.columns:
+            return df.select(index_columns)
 
-    # df.dropna(inplace=True)
+        return df.select(
+            *index_columns,
+            pl.col(keep_column).fill_null(strategy='forward').fill_null(strategy='backward'),
+        )
 
-    return df
+    # Nothing to keep, e.g. in the empty frame yfinance returns for a failed download
+    if keep_column not in df.columns:
+        return df[[]]
+
+    # Already processed frames need neither a column selection nor a fill
+    if len(df.columns) == 1 and df.columns[0] == keep_column and not df[keep_column].isna().any():
+        return df
+
+    values = df[keep_column].to_numpy()
+    if not np.issubdtype(values.dtype, np.floating):
+        # Fill forward then Backward Fill remaining NaNs
+        return df[[keep_column]].ffill().bfill()
+
+    # Adopt the kernel's output buffer rather than letting the constructor copy it
+    return pd.DataFrame({keep_column: _fill_gaps_1d(values)}, index=df.index, copy=False)
+
+
+@njit(cache=True)
+def _fill_gaps_1d(a: np.ndarray) -> np.ndarray:
+    """
+    Fills NaNs forward, then fills the leading NaNs backward from the first valid value.
+    A single scan replaces the two passes and two allocations of ffill().bfill().
+    """
+    out = np.empty_like(a)
+    first = -1
+    last = np.nan
+    for i in range(a.shape[0]):
+        if not np.isnan(a[i]):
+            last = a[i]
+            if first < 0:
+                first = i
+        out[i] = last
+
+    for i in range(first):
+        out[i] = a[first]
+
+    return out
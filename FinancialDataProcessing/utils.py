@@ -1,5 +1,60 @@
 import numpy as np
-from typing import Union, Sequence
+from functools import lru_cache
+from numba import njit, guvectorize
+from typing import Union, Sequence, Dict, Tuple, Callable
+
+# Descriptive names of pandas period codes
+_PERIODS: Dict[str, str] = {
+    "B": "business day",
+    "C": "custom business day",
+    "D": "daily",
+    "WE": "weekly",
+    "ME": "monthly",
+    "YE": "Yearly",
+    "BM": "business month end",
+    "CBM": "custom business month end",
+    "MS": "month start",
+    "BMS": "business month start",
+    "CBMS": "custom business month start",
+    "Q": "quarterly",
+    "BQ": "business quarter end",
+    "QS": "quarter start",
+    "BQS": "business quarter start",
+    "Y": "yearly",
+    "A": "yearly",
+    "BA": "business year end",
+    "AS": "year start",
+    "BAS": "business year start",
+    "H": "hourly",
+    "T": "minutely",
+    "S": "secondly",
+    "L": "milliseconds",
+    "U": "microseconds",
+}
+
+# Compiled scalers built by make_scaler, keyed by their source and destination ranges
+_SCALERS: Dict[Tuple[Tuple[float, float], Tuple[float, float]], Callable[[float], float]] = {}
+
+
+@njit(cache=True)
+def _scale_values(arr: np.ndarray, factor: float) -> np.ndarray:
+    """
+    Multiplies every element of a flat array by a factor, leaving NaNs untouched.
+    """
+    out = np.empty(arr.shape[0], dtype=np.float64)
+    for i in range(arr.shape[0]):
+        out[i] = arr[i] * factor
+    return out
+
+
+def _format_array(arr: np.ndarray, factor: float, decimals: int, suffix: str = "") -> np.ndarray:
+    """
+    Formats the scaled elements of an array as strings, using "-" for NaNs.
+    """
+    arr = np.asarray(arr, dtype=np.float64)
+    scaled = _scale_values(np.ascontiguousarray(arr).ravel(), factor)
+    out = np.array([("-" if m != m else f"{m:.{decimals}f}{suffix}") for m in scaled.tolist()], dtype=object)
+    return out.reshape(arr.shape)
 
 
 def to_percent(number: float) -> str:
@@ -12,9 +67,21 @@ def to_percent(number: float) -> str:
     Returns:
         str: The formatted percentage string. If the number is NaN, returns "-".
     """
-    if np.isnan(number):
-        return "-"
-    return format(number, ".2%")
+    # NaN is the only value not equal to itself
+    return "-" if number != number else f"{number:.2%}"
+
+
+def to_percent_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Converts an array of floating-point numbers to percentage strings.
+
+    Parameters:
+        arr (np.ndarray): The numbers to be converted to percentages.
+
+    Returns:
+        np.ndarray: An object array of formatted percentage strings, with "-" for NaNs.
+    """
+    return _format_array(arr, 100.0, 2, "%")
 
 
 def to_percent_num(number: float) -> str:
@@ -27,9 +94,20 @@ def to_percent_num(number: float) -> str:
     Returns:
         str: The formatted percentage string without the '%' sign. If the number is NaN, returns "-".
     """
-    if np.isnan(number):
-        return "-"
-    return format(number * 100, ".2f")
+    return "-" if number != number else f"{number * 100:.2f}"
+
+
+def to_percent_num_array(arr: np.ndarray) -> np.ndarray:
+    """
+    Converts an array of floating-point numbers to percentage strings without the '%' sign.
+
+    Parameters:
+        arr (np.ndarray): The numbers to be converted to percentages.
+
+    Returns:
+        np.ndarray: An object array of formatted percentage strings, with "-" for NaNs.
+    """
+    return _format_array(arr, 100.0, 2)
 
 
 def to_float(number: float, decimals: int = 2) -> str:
@@ -43,12 +121,24 @@ def to_float(number: float, decimals: int = 2) -> str:
     Returns:
         str: The formatted number as a string. If the number is NaN, returns "-".
     """
-    if np.isnan(number):
-        return "-"
-    format_string = f".{decimals}f"
-    return format(number, format_string)
+    return "-" if number != number else f"{number:.{decimals}f}"
 
 
+def to_float_array(arr: np.ndarray, decimals: int = 2) -> np.ndarray:
+    """
+    Formatting helper for arrays of floats with a specified number of decimals.
+
+    Parameters:
+        arr (np.ndarray): The numbers to format.
+        decimals (int): The number of decimal places to format the numbers to.
+
+    Returns:
+        np.ndarray: An object array of formatted numbers, with "-" for NaNs.
+    """
+    return _format_array(arr, 1.0, decimals)
+
+
+@lru_cache(maxsize=64)
 def get_freq(period: str) -> Union[str, None]:
     """
     Returns the descriptive name of a given period code.
@@ -59,36 +149,7 @@ def get_freq(period: str) -> Union[str, None]:
     Returns:
         Union[str, None]: The descriptive name of the period code. If the period code is not found, returns None.
     """
-    period = period.upper()
-    periods = {
-        "B": "business day",
-        "C": "custom business day",
-        "D": "daily",
-        "WE": "weekly",
-        "ME": "monthly",
-        "YE": "Yearly",
-        "BM": "business month end",
-        "CBM": "custom business month end",
-        "MS": "month start",
-        "BMS": "business month start",
-        "CBMS": "custom business month start",
-        "Q": "quarterly",
-        "BQ": "business quarter end",
-        "QS": "quarter start",
-        "BQS": "business quarter start",
-        "Y": "yearly",
-        "A": "yearly",
-        "BA": "business year end",
-        "AS": "year start",
-        "BAS": "business year start",
-        "H": "hourly",
-        "T": "minutely",
-        "S": "secondly",
-        "L": "milliseconds",
-        "U": "microseconds",
-    }
-
-    return periods.get(period, None)
+    return _PERIODS.get(period.upper(), None)
 
 
 def scale(val: float, src: Sequence[float], dst: Sequence[float]) -> float:
@@ -112,6 +173,8 @@ def scale(val: float, src: Sequence[float], dst: Sequence[float]) -> float:
         -1.0
         >>> scale(50, (0.0, 100.0), (0.0, 1.0))
         0.5
+        >>> scale(float('nan'), (0.0, 1.0), (0.0, 10.0))
+        nan
     """
     if val < src[0]:
         return dst[0]
@@ -119,3 +182,96 @@ def scale(val: float, src: Sequence[float], dst: Sequence[float]) -> float:
         return dst[1]
 
     return ((val - src[0]) / (src[1] - src[0])) * (dst[1] - dst[0]) + dst[0]
+
+
+# Compiled `scale` for calling from other @njit code, where it is inlined into the caller.
+# Plain Python callers should use `scale`, which avoids the dispatch overhead.
+scale_jit = njit(cache=True, inline='always')(scale)
+
+
+def make_scaler(src: Sequence[float], dst: Sequence[float]) -> Callable[[float], float]:
+    """
+    Builds a compiled version of `scale` with the source and destination ranges fixed.
+    The range bounds and slope are compile-time constants, so each call is a clip and a multiply-add.
+    Scalers are shared between calls with the same ranges.
+
+    Parameters:
+        src (Sequence[float]): A sequence of two floats representing the source range.
+        dst (Sequence[float]): A sequence of two floats representing the destination range.
+
+    Returns:
+        Callable[[float], float]: A function scaling a value from `src` to `dst`, usable inside @njit code.
+
+    Examples:
+        >>> to_unit = make_scaler((0.0, 100.0), (0.0, 1.0))
+        >>> to_unit(50.0)
+        0.5
+        >>> to_unit(-5.0)
+        0.0
+        >>> to_unit(float('nan'))
+        nan
+    """
+    s0, s1 = float(src[0]), float(src[1])
+    d0, d1 = float(dst[0]), float(dst[1])
+    key = ((s0, s1), (d0, d1))
+    scaler = _SCALERS.get(key)
+    if scaler is None:
+        inv = (d1 - d0) / (s1 - s0)
+
+        @njit(cache=True, fastmath={'contract'})
+        def scaler(val):
+            return (min(max(val, s0), s1) - s0) * inv + d0
+
+        _SCALERS[key] = scaler
+
+    return scaler
+
+
+def scale_array(vals: Union[float, np.ndarray], src: np.ndarray, dst: np.ndarray) -> Union[float, np.ndarray]:
+    """
+    Vectorized version of `scale` for NumPy arrays of values.
+    Polars Series without nulls can be passed directly as well.
+    The single-precision loop is only used when `src` and `dst` are float32 too; otherwise NumPy
+    promotes the values to float64. NaN values are propagated.
+
+    Parameters:
+        vals (Union[float, np.ndarray]): The value or values to be scaled.
+        src (np.ndarray): An array of two floats representing the source range.
+        dst (np.ndarray): An array of two floats representing the destination range.
+
+    Returns:
+        Union[float, np.ndarray]: The values scaled to the destination range, a scalar for a scalar input.
+
+    Raises:
+        ValueError: If `src` or `dst` does not hold exactly two values.
+
+    Examples:
+        >>> scale_array(np.array([-5.0, 50.0, 150.0]), np.array([0.0, 100.0]), np.array([0.0, 1.0]))
+        array([0. , 0.5, 1. ])
+        >>> scale_array(np.array([np.nan]), np.array([0.0, 100.0]), np.array([0.0, 1.0]))
+        array([nan])
+        >>> print(scale_array(50.0, np.array([0.0, 100.0]), np.array([0.0, 1.0])))
+        0.5
+    """
+    # The kernel reads src[1] and dst[1] unchecked, so short ranges must be rejected here
+    if np.shape(src) != (2,) or np.shape(dst) != (2,):
+        raise ValueError(f"Invalid ranges: src and dst must hold two values each, got shapes "
+                         f"{np.shape(src)} and {np.shape(dst)}.")
+
+    # The kernel loops over a 1-d core dimension, so scalars are lifted to one element and unwrapped again
+    out = _scale_array_kernel(np.atleast_1d(vals), src, dst)
+    return out[0] if np.ndim(vals) == 0 else out
+
+
+@guvectorize(['void(f4[:], f4[:], f4[:], f4[:])', 'void(f8[:], f8[:], f8[:], f8[:])'], '(n),(m),(m)->(n)',
+             nopython=True, cache=True, fastmath={'contract'})
+def _scale_array_kernel(vals, src, dst, out):
+    """
+    Scales a 1-d array of values, with the ranges already checked by `scale_array`.
+    """
+    s0, s1 = src[0], src[1]
+    d0, d1 = dst[0], dst[1]
+    inv = (d1 - d0) / (s1 - s0)
+    # Clipping with min/max keeps the loop branch-free so it vectorizes; 'contract' only permits the FMA
+    for i in range(vals.shape[0]):
+        out[i] = (min(max(vals[i], s0), s1) - s0) * inv + d0